@@ -72,6 +72,9 @@ const (
 	styleDefaultFile = "default.css"
 )
 
+// ogAccentColorPattern is compiled once; ogCardForPage runs for every page of a build.
+var ogAccentColorPattern = cssVarColorPattern("--og-accent")
+
 func NewBuilder(db *sql.DB, blobs *blob.Store, websitesRoot string, logger *slog.Logger) (*Builder, error) {
 	if db == nil {
 		return nil, fmt.Errorf("database is required")
@@ -986,7 +989,7 @@ func ogCardForPage(site *model.Site, page model.Page) ogimage.Card {
 	}
 	// Read accent color from the site's design tokens.
 	// Sites define --og-accent: #hexcolor in tokens.css to brand their OG cards.
-	accentColor := parseCSSVarColor(site.Styles.TokensCSS, "--og-accent")
+	accentColor := matchCSSVarColor(site.Styles.TokensCSS, ogAccentColorPattern)
 	return ogimage.Card{
 		Title:       title,
 		Description: description,
@@ -1000,7 +1003,14 @@ func ogCardForPage(site *model.Site, page model.Page) ogimage.Card {
 // The search is boundary-aware: varName must be preceded by whitespace, '{', or ';'
 // to avoid partial matches against longer property names.
 func parseCSSVarColor(css, varName string) string {
-	re := regexp.MustCompile(`(?:^|[\s{;])` + regexp.QuoteMeta(varName) + `\s*:\s*(#[0-9a-fA-F]{6}|#[0-9a-fA-F]{3})`)
+	return matchCSSVarColor(css, cssVarColorPattern(varName))
+}
+
+func cssVarColorPattern(varName string) *regexp.Regexp {
+	return regexp.MustCompile(`(?:^|[\s{;])` + regexp.QuoteMeta(varName) + `\s*:\s*(#[0-9a-fA-F]{6}|#[0-9a-fA-F]{3})`)
+}
+
+func matchCSSVarColor(css string, re *regexp.Regexp) string {
 	if m := re.FindStringSubmatch(css); len(m) >= 2 {
 		return strings.ToLower(m[1])
 	}